@@ -16,9 +16,11 @@ import os
 import sys
 import re
 import json
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 try:
     import javalang
@@ -27,26 +29,504 @@ except ImportError:
     print("Kurulum: pip install javalang")
     sys.exit(1)
 
+# Opsiyonel: varsa usage ve method çağrısı taraması tek geçişte yapılır
+# Kurulum: pip install pyahocorasick
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Basit regex ile method çağrısı: `.isim(`; Java identifier'ları `$` içerebilir
+METHOD_CALL_RE = re.compile(r'\.((?:[^\W\d]|\$)[\w$]*)\s*\(')
+
+# Yorumlar, text block, string ve char literal'ları: gerçek kullanım içeremezler
+JAVA_NOISE_RE = re.compile(
+    r'//[^\n]*|/\*.*?\*/|"""[\s\S]*?"""|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'',
+    re.DOTALL
+)
+
+# Interface kullanım kalıpları; {names} tüm interface isimlerinin alternation'ı
+USAGE_PATTERN_TEMPLATE = (
+    r'(?<![\w$])({names})(?=\s+[\w$])'  # Type declaration (parametreler dahil: `(Foo x`)
+    r'|<({names})>'                      # Generic type
+)
+
+
+def _is_call_suffix(content: str, index: int) -> bool:
+    """index'ten itibaren boşluklar ve '(' geliyor mu (METHOD_CALL_RE'nin sağ tarafı)"""
+    length = len(content)
+    while index < length and content[index].isspace():
+        index += 1
+    return index < length and content[index] == '('
+
+
+def _is_usage_context(content: str, before: str, index: int) -> bool:
+    """index'te biten isim USAGE_PATTERN_TEMPLATE kalıplarından birine uyuyor mu"""
+    if before == '<' and content[index:index + 1] == '>':
+        return True  # Generic type
+    if _is_identifier_char(before):
+        return False
+    return _is_declaration_suffix(content, index)  # Type declaration
+
+
+def _is_declaration_suffix(content: str, index: int) -> bool:
+    """index'ten itibaren en az bir boşluk ve ardından kelime karakteri geliyor mu"""
+    length = len(content)
+    start = index
+    while index < length and content[index].isspace():
+        index += 1
+    return index > start and index < length and _is_identifier_char(content[index])
+
+
+def _is_identifier_char(char: str) -> bool:
+    """Java identifier karakteri mi (regex'lerdeki `[\\w$]` karşılığı)"""
+    return bool(char) and (char.isalnum() or char in '_$')
 
-@dataclass
+
+def compile_usage_pattern(names) -> re.Pattern:
+    """Verilen interface isimleri için tek bir usage regex'i derler"""
+    # Uzun isimler önce gelsin ki alternation kısa önekte takılmasın
+    ordered = sorted(names, key=len, reverse=True)
+    alternation = '|'.join(map(re.escape, ordered))
+    return re.compile(USAGE_PATTERN_TEMPLATE.format(names=alternation))
+
+
+# Python 3.10+ üzerinde instance başına __dict__ yerine __slots__ kullanılır
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class InterfaceInfo:
     """Bir interface hakkındaki tüm bilgileri tutar"""
     name: str
     file_path: str
     methods: List[str] = field(default_factory=list)
     implementations: List[str] = field(default_factory=list)
-    usages: List[str] = field(default_factory=list)  # Bu interface'i kullanan classlar
+    usages: Set[str] = field(default_factory=set)  # Bu interface'i kullanan classlar
     method_calls: Dict[str, int] = field(default_factory=dict)  # Her metodun çağrılma sayısı
     extends: List[str] = field(default_factory=list)  # Extend ettiği interface'ler
 
 
+@dataclass(**DATACLASS_SLOTS)
+class ClassInfo:
+    """Bir class hakkındaki tüm bilgileri tutar"""
+    name: str
+    file_path: str
+    implements: List[str] = field(default_factory=list)  # Implement ettiği interface'ler
+    extends: Optional[str] = None  # Extend ettiği class
+    methods: List[str] = field(default_factory=list)
+    method_calls: List[str] = field(default_factory=list)
+    # Yorum ve string'leri temizlenmiş kaynak; analiz bitince boşaltılır
+    clean_source: str = ''
+
+
 @dataclass 
 class AnalysisResult:
     """Analiz sonuçlarını tutar"""
     interfaces: Dict[str, InterfaceInfo] = field(default_factory=dict)
-    classes: Dict[str, dict] = field(default_factory=dict)
+    classes: Dict[str, ClassInfo] = field(default_factory=dict)
     total_classes: int = 0
-    call_graph: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+    call_graph: Dict[str, List[str]] = field(default_factory=dict)  # interface -> extends, topolojik sırada
+
+
+@dataclass(**DATACLASS_SLOTS)
+class TypeHeader:
+    """Bir class/interface bildiriminin gövde dışında kalan özeti"""
+    kind: str  # 'class' veya 'interface'
+    name: str
+    extends: List[str] = field(default_factory=list)
+    implements: List[str] = field(default_factory=list)
+    methods: List[str] = field(default_factory=list)
+
+
+class HeaderScanError(Exception):
+    """Token akışı beklenmedik bir yapıda; tam parse'a geri dönülür"""
+
+
+class JavaHeaderScanner:
+    """Java token akışından class/interface başlıklarını çıkarır.
+    
+    Analiz yalnızca bildirim başlıklarına ve metod isimlerine baktığı için
+    tam AST kurulmaz: metod gövdeleri ve initializer'lar parantez sayılarak
+    atlanır, içlerinde yalnızca local class/interface bildirimleri aranır.
+    Bildirimler javalang'ın `filter` sırasıyla (pre-order) döner.
+    """
+    
+    def __init__(self, tokens: list):
+        self.tokens = tokens
+        self.pos = 0
+        self.headers: List[TypeHeader] = []
+    
+    def scan(self) -> List[TypeHeader]:
+        while self.pos < len(self.tokens):
+            self._member(None)
+        return self.headers
+    
+    def _peek(self, offset: int = 0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+    
+    def _next(self):
+        if self.pos >= len(self.tokens):
+            raise HeaderScanError("beklenmedik dosya sonu")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+    
+    @staticmethod
+    def _is(token, kind, value=None) -> bool:
+        return isinstance(token, kind) and (value is None or token.value == value)
+    
+    def _is_type_keyword(self, token) -> bool:
+        """Local/nested type bildirimi başlatan keyword mü (`Foo.class` hariç)"""
+        if not self._is(token, javalang.tokenizer.Keyword) or \
+                token.value not in ('class', 'interface', 'enum'):
+            return False
+        previous = self.tokens[self.pos - 2] if self.pos >= 2 else None
+        return not (self._is(previous, javalang.tokenizer.Separator, '.') or
+                    self._is(previous, javalang.tokenizer.Annotation))
+    
+    def _skip_annotation(self):
+        """`@Ad.Soyad(...)` annotation'ını atlar"""
+        self._next()
+        self._next()
+        while self._is(self._peek(), javalang.tokenizer.Separator, '.'):
+            self.pos += 2
+        if self._is(self._peek(), javalang.tokenizer.Separator, '('):
+            self._skip_group()
+    
+    def _skip_angles(self):
+        """`<...>` generic bloğunu atlar (`>>` ve `>>>` birden fazla kapatır)"""
+        depth = 0
+        while True:
+            token = self._next()
+            if self._is(token, javalang.tokenizer.Operator):
+                if token.value == '<':
+                    depth += 1
+                elif token.value in ('>', '>>', '>>>'):
+                    depth -= len(token.value)
+            elif self._is(token, javalang.tokenizer.Separator) and token.value in '{};':
+                raise HeaderScanError(f"generic içinde '{token.value}'")
+            if depth <= 0:
+                return
+    
+    def _skip_group(self):
+        """`(...)` veya `[...]` grubunu atlar; içteki bloklar da taranır"""
+        depth = 0
+        while True:
+            token = self._next()
+            if self._is(token, javalang.tokenizer.Separator):
+                if token.value in '([':
+                    depth += 1
+                elif token.value in ')]':
+                    depth -= 1
+                    if depth == 0:
+                        return
+                elif token.value == '{':
+                    self.pos -= 1
+                    self._skip_block()
+                elif token.value in '};':
+                    raise HeaderScanError(f"parantez içinde '{token.value}'")
+    
+    def _skip_block(self):
+        """`{...}` gövdesini atlar, içindeki local type bildirimlerini toplar"""
+        depth = 0
+        while True:
+            token = self._next()
+            if self._is(token, javalang.tokenizer.Separator, '{'):
+                depth += 1
+            elif self._is(token, javalang.tokenizer.Separator, '}'):
+                depth -= 1
+                if depth == 0:
+                    return
+            elif self._is_type_keyword(token):
+                self._type_declaration(token.value)
+    
+    def _skip_statement(self):
+        """`;` ile biten field initializer'ı veya annotation default'unu atlar"""
+        while True:
+            token = self._peek()
+            if self._is(token, javalang.tokenizer.Separator, ';'):
+                self.pos += 1
+                return
+            if self._is(token, javalang.tokenizer.Separator) and token.value in '([':
+                self._skip_group()
+            elif self._is(token, javalang.tokenizer.Separator, '{'):
+                self._skip_block()
+            elif self._is(token, javalang.tokenizer.Separator, '}'):
+                raise HeaderScanError("bildirim ';' olmadan bitti")
+            else:
+                self._next()
+                if self._is_type_keyword(token):
+                    self._type_declaration(token.value)
+    
+    def _type_declaration(self, kind: str):
+        """`class`/`interface`/`enum`/`@interface` keyword'ünden sonrasını işler"""
+        name = self._next()
+        if not self._is(name, javalang.tokenizer.Identifier):
+            raise HeaderScanError(f"{kind} ismi bekleniyordu")
+        
+        header = None
+        if kind in ('class', 'interface'):
+            header = TypeHeader(kind=kind, name=name.value)
+            self.headers.append(header)
+        
+        # extends/implements listelerinde her tipin ilk segmentini topla
+        target: List[str] = []
+        expect_type = False
+        while True:
+            token = self._peek()
+            if self._is(token, javalang.tokenizer.Separator, '{'):
+                break
+            if self._is(token, javalang.tokenizer.Operator, '<'):
+                self._skip_angles()
+                continue
+            if self._is(token, javalang.tokenizer.Annotation):
+                self._skip_annotation()
+                continue
+            self._next()
+            if self._is(token, javalang.tokenizer.Keyword, 'extends'):
+                target = header.extends if header else []
+                expect_type = True
+            elif self._is(token, javalang.tokenizer.Keyword, 'implements'):
+                target = header.implements if header else []
+                expect_type = True
+            elif self._is(token, javalang.tokenizer.Identifier) and expect_type:
+                target.append(token.value)
+                expect_type = False
+            elif self._is(token, javalang.tokenizer.Identifier, 'permits'):
+                target = []
+            elif self._is(token, javalang.tokenizer.Separator, ','):
+                expect_type = True
+            elif self._is(token, javalang.tokenizer.Separator) and token.value in '};':
+                raise HeaderScanError(f"{name.value} gövdesi bulunamadı")
+        
+        self._body(header, kind)
+    
+    def _body(self, header: Optional[TypeHeader], kind: str):
+        """Type gövdesindeki üyeleri işler"""
+        self._next()
+        if kind == 'enum':
+            self._enum_constants()
+        while not self._is(self._peek(), javalang.tokenizer.Separator, '}'):
+            self._member(header, kind)
+        self._next()
+    
+    def _enum_constants(self):
+        """Enum sabitlerini (argümanları ve gövdeleriyle) atlar"""
+        while True:
+            token = self._peek()
+            if self._is(token, javalang.tokenizer.Separator, '}'):
+                return
+            if self._is(token, javalang.tokenizer.Separator, ';'):
+                self.pos += 1
+                return
+            if self._is(token, javalang.tokenizer.Separator, '('):
+                self._skip_group()
+            elif self._is(token, javalang.tokenizer.Separator, '{'):
+                self._skip_block()
+            else:
+                self._next()
+    
+    def _member(self, header: Optional[TypeHeader], kind: Optional[str] = None):
+        """Tek bir üye bildirimini işler; kind None ise dosyanın en üst seviyesi"""
+        token = self._peek()
+        if self._is(token, javalang.tokenizer.Separator, ';'):
+            self.pos += 1
+            return
+        if kind is None and self._is(token, javalang.tokenizer.Keyword) and \
+                token.value in ('package', 'import'):
+            self._skip_statement()
+            return
+        
+        # Modifier ve annotation'lar
+        while True:
+            token = self._peek()
+            if self._is(token, javalang.tokenizer.Modifier):
+                self.pos += 1
+            elif self._is(token, javalang.tokenizer.Annotation) and \
+                    not self._is(self._peek(1), javalang.tokenizer.Keyword, 'interface'):
+                self._skip_annotation()
+            else:
+                break
+        
+        token = self._next()
+        if self._is(token, javalang.tokenizer.Annotation):
+            self._next()
+            self._type_declaration('annotation')
+            return
+        if self._is(token, javalang.tokenizer.Keyword) and \
+                token.value in ('class', 'interface', 'enum'):
+            self._type_declaration(token.value)
+            return
+        if kind is None:
+            raise HeaderScanError(f"beklenmedik token: {token.value}")
+        if self._is(token, javalang.tokenizer.Separator, '{'):
+            # Initializer bloğu
+            self.pos -= 1
+            self._skip_block()
+            return
+        
+        # Generic metodun tip parametreleri
+        if self._is(token, javalang.tokenizer.Operator, '<'):
+            self.pos -= 1
+            self._skip_angles()
+            token = self._next()
+        if self._is(token, javalang.tokenizer.Identifier, 'record'):
+            raise HeaderScanError("record desteklenmiyor")
+        
+        # İlk '(' metod, '=' / ';' / ',' field bildirimi demektir
+        first = token
+        name = None
+        while not self._is(token, javalang.tokenizer.Separator, '('):
+            if self._is(token, javalang.tokenizer.Separator, ';'):
+                return
+            if self._is(token, javalang.tokenizer.Separator, ',') or \
+                    self._is(token, javalang.tokenizer.Operator, '='):
+                self._skip_statement()
+                return
+            if self._is(token, javalang.tokenizer.Separator) and token.value in '{}':
+                raise HeaderScanError(f"üye bildiriminde '{token.value}'")
+            if self._is(token, javalang.tokenizer.Operator, '<'):
+                self.pos -= 1
+                self._skip_angles()
+            elif self._is(token, javalang.tokenizer.Annotation):
+                self.pos -= 1
+                self._skip_annotation()
+            name = token
+            token = self._next()
+        if name is None:
+            raise HeaderScanError("metod ismi bulunamadı")
+        
+        self.pos -= 1
+        self._skip_group()
+        
+        # throws listesi, dizi boyutları veya annotation default değeri
+        while True:
+            token = self._peek()
+            if self._is(token, javalang.tokenizer.Separator, '{'):
+                self._skip_block()
+                break
+            if self._is(token, javalang.tokenizer.Separator, ';'):
+                self.pos += 1
+                break
+            if self._is(token, javalang.tokenizer.Modifier, 'default'):
+                self._skip_statement()
+                break
+            if self._is(token, javalang.tokenizer.Separator, '}'):
+                raise HeaderScanError("metod bildirimi tamamlanmadı")
+            self._next()
+        
+        # İsim üyenin ilk token'ıysa dönüş tipi yoktur: constructor
+        if header is not None and name is not first:
+            header.methods.append(name.value)
+
+
+def _process_interface(header: TypeHeader, file_path: str) -> InterfaceInfo:
+    """Interface başlığını işler"""
+    info = InterfaceInfo(
+        name=header.name,
+        file_path=file_path
+    )
+    
+    # Metodları topla
+    for method_name in header.methods:
+        info.methods.append(method_name)
+        info.method_calls[method_name] = 0
+    
+    # Extend edilen interface'leri topla
+    info.extends.extend(header.extends)
+    
+    return info
+
+
+def _process_class(header: TypeHeader, file_path: str, clean_source: str) -> ClassInfo:
+    """Class başlığını işler; clean_source aynı dosyadaki class'larca paylaşılır"""
+    return ClassInfo(
+        name=header.name,
+        file_path=file_path,
+        implements=list(header.implements),
+        extends=header.extends[0] if header.extends else None,
+        methods=list(header.methods),
+        clean_source=clean_source
+    )
+
+
+def _header_from_node(node, kind: str) -> TypeHeader:
+    """javalang AST node'unu TypeHeader'a çevirir (tam parse yolu)"""
+    header = TypeHeader(kind=kind, name=node.name)
+    if node.methods:
+        header.methods = [method.name for method in node.methods]
+    
+    extends = node.extends
+    if extends and not isinstance(extends, list):
+        extends = [extends]
+    header.extends = [ext.name for ext in extends or [] if hasattr(ext, 'name')]
+    
+    if kind == 'class' and node.implements:
+        header.implements = [impl.name for impl in node.implements if hasattr(impl, 'name')]
+    return header
+
+
+def _scan_headers(content: str) -> List[TypeHeader]:
+    """Dosyadaki class/interface başlıklarını pre-order sırasıyla döner.
+    
+    Önce yalnızca token akışı taranır; tarayıcının tanımadığı bir yapı
+    görülürse javalang ile tam parse'a geri dönülür.
+    
+    Not: metod gövdeleri parse edilmediği için javalang'ın reddettiği bazı
+    Java 14+ dosyaları (switch expression, text block, type annotation,
+    receiver parametresi) da analize dahil edilir; tam parse bunları
+    "parse edilemedi" uyarısıyla atlıyordu.
+    """
+    try:
+        tokens = list(javalang.tokenizer.tokenize(content))
+        return JavaHeaderScanner(tokens).scan()
+    except (HeaderScanError, javalang.tokenizer.LexerError):
+        pass
+    
+    tree = javalang.parse.parse(content)
+    headers = []
+    for path, node in tree:
+        if isinstance(node, javalang.tree.InterfaceDeclaration):
+            headers.append(_header_from_node(node, 'interface'))
+        elif isinstance(node, javalang.tree.ClassDeclaration):
+            headers.append(_header_from_node(node, 'class'))
+    return headers
+
+
+def parse_java_file(file_path: str) -> Tuple[List[InterfaceInfo], List[ClassInfo], Optional[str]]:
+    """Tek bir Java dosyasını parse eder.
+    
+    Worker process'lerde çalışabilmesi için analyzer state'ine dokunmaz;
+    bulunan interface'leri, class'ları ve varsa hata mesajını döner.
+    """
+    interfaces = []
+    classes = []
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        
+        headers = _scan_headers(content)
+        
+        for header in headers:
+            if header.kind == 'interface':
+                interfaces.append(_process_interface(header, file_path))
+        
+        class_headers = [header for header in headers if header.kind == 'class']
+        if class_headers:
+            # Sonraki analiz adımları dosyayı tekrar okumasın; yorum ve string'ler
+            # regex'lere yanlış eşleşme vermesin diye dosya başına bir kez
+            # temizlenir ve nested/local class'lar aynı metni paylaşır
+            clean_source = JAVA_NOISE_RE.sub(' ', content)
+            for header in class_headers:
+                classes.append(_process_class(header, file_path, clean_source))
+            
+    except Exception as e:
+        return interfaces, classes, str(e)
+    
+    return interfaces, classes, None
 
 
 class InterfacePoisoningAnalyzer:
@@ -62,6 +542,10 @@ class InterfacePoisoningAnalyzer:
         self.project_path = project_path
         self.result = AnalysisResult()
         self.max_call_depth = 1
+        self._depth_cache: Dict[str, int] = {}  # interface adı -> inheritance derinliği
+        self._ipi_cache: Dict[str, dict] = {}  # interface adı -> IPI sonucu
+        self.results: List[dict] = []  # Interface başına IPI sonuçları
+        self.impls_by_iface: Dict[str, Set[str]] = {}  # interface adı -> implement eden class'lar
         
     def analyze(self) -> AnalysisResult:
         """Ana analiz fonksiyonu"""
@@ -71,9 +555,8 @@ class InterfacePoisoningAnalyzer:
         java_files = self._find_java_files()
         print(f"  {len(java_files)} Java dosyası bulundu")
         
-        # 2. Her dosyayı parse et
-        for file_path in java_files:
-            self._parse_file(file_path)
+        # 2. Her dosyayı parse et (javalang saf Python, GIL'e takılmamak için process'ler)
+        self._parse_files(java_files)
         
         print(f"  {len(self.result.interfaces)} interface bulundu")
         print(f"  {len(self.result.classes)} class bulundu")
@@ -81,178 +564,221 @@ class InterfacePoisoningAnalyzer:
         # 3. Implementation ilişkilerini bul
         self._find_implementations()
         
-        # 4. Usage ilişkilerini bul
-        self._find_usages()
+        if ahocorasick is not None:
+            # 4-5. Usage ve method çağrılarını tek geçişte bul
+            self._scan_with_automaton()
+        else:
+            # 4. Usage ilişkilerini bul
+            self._find_usages()
+            
+            # 5. Method çağrılarını analiz et
+            self._analyze_method_calls()
         
-        # 5. Method çağrılarını analiz et
-        self._analyze_method_calls()
+        # Kaynak metinler artık gerekmiyor, belleği serbest bırak
+        for class_info in self.result.classes.values():
+            class_info.clean_source = ''
         
         # 6. Call depth hesapla
+        self._depth_cache.clear()
         self._calculate_call_depths()
         
         self.result.total_classes = len(self.result.classes)
         
+        # 7. IPI'ları bir kez hesapla, rapor ve JSON export bunu kullanır
+        self._ipi_cache.clear()
+        self.results = self.calculate_all_ipi()
+        
         return self.result
     
     def _find_java_files(self) -> List[str]:
         """Projedeki tüm .java dosyalarını bulur"""
         java_files = []
         for root, dirs, files in os.walk(self.project_path):
-            # Test dosyalarını atla
-            if 'test' in root.lower():
-                continue
+            # Test dizinlerine hiç inme (dirs yerinde budanır)
+            dirs[:] = [d for d in dirs if 'test' not in d.lower()]
             for file in files:
                 if file.endswith('.java'):
                     java_files.append(os.path.join(root, file))
         return java_files
     
-    def _parse_file(self, file_path: str):
-        """Tek bir Java dosyasını parse eder"""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            tree = javalang.parse.parse(content)
-            
-            for _, node in tree.filter(javalang.tree.InterfaceDeclaration):
-                self._process_interface(node, file_path)
-            
-            for _, node in tree.filter(javalang.tree.ClassDeclaration):
-                self._process_class(node, file_path, content)
-                
-        except Exception as e:
-            print(f"  Uyarı: {file_path} parse edilemedi: {e}")
-    
-    def _process_interface(self, node, file_path: str):
-        """Interface node'unu işler"""
-        info = InterfaceInfo(
-            name=node.name,
-            file_path=file_path
-        )
-        
-        # Metodları topla
-        if node.methods:
-            for method in node.methods:
-                info.methods.append(method.name)
-                info.method_calls[method.name] = 0
-        
-        # Extend edilen interface'leri topla
-        if node.extends:
-            for ext in node.extends:
-                if hasattr(ext, 'name'):
-                    info.extends.append(ext.name)
-        
-        self.result.interfaces[node.name] = info
-    
-    def _process_class(self, node, file_path: str, content: str):
-        """Class node'unu işler"""
-        class_info = {
-            'name': node.name,
-            'file_path': file_path,
-            'implements': [],
-            'extends': None,
-            'methods': [],
-            'method_calls': []
-        }
-        
-        # Implement edilen interface'leri topla
-        if node.implements:
-            for impl in node.implements:
-                if hasattr(impl, 'name'):
-                    class_info['implements'].append(impl.name)
-        
-        # Extend edilen class'ı topla
-        if node.extends:
-            if hasattr(node.extends, 'name'):
-                class_info['extends'] = node.extends.name
-        
-        # Metodları topla
-        if node.methods:
-            for method in node.methods:
-                class_info['methods'].append(method.name)
-        
-        self.result.classes[node.name] = class_info
+    def _parse_files(self, java_files: List[str]):
+        """Java dosyalarını paralel parse eder ve sonuçları birleştirir"""
+        # Windows'ta ProcessPoolExecutor en fazla 61 worker kabul eder
+        workers = min(os.cpu_count() or 1, 61)
+        chunksize = max(1, len(java_files) // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(parse_java_file, java_files, chunksize=chunksize)
+            for file_path, (interfaces, classes, error) in zip(java_files, parsed):
+                for info in interfaces:
+                    self.result.interfaces[info.name] = info
+                for class_info in classes:
+                    self.result.classes[class_info.name] = class_info
+                if error is not None:
+                    print(f"  Uyarı: {file_path} parse edilemedi: {error}")
     
     def _find_implementations(self):
         """Her interface için implement eden class'ları bulur"""
+        # Ters implements haritasını tek geçişte kur (set: tekrarlar elenir)
+        impls_by_iface: Dict[str, Set[str]] = defaultdict(set)
         for class_name, class_info in self.result.classes.items():
-            for iface_name in class_info['implements']:
-                if iface_name in self.result.interfaces:
-                    self.result.interfaces[iface_name].implementations.append(class_name)
+            for iface_name in class_info.implements:
+                impls_by_iface[iface_name].add(class_name)
+        self.impls_by_iface = impls_by_iface
+        
+        for iface_name, iface_info in self.result.interfaces.items():
+            if iface_name in impls_by_iface:
+                iface_info.implementations = sorted(impls_by_iface[iface_name])
     
     def _find_usages(self):
         """Her interface'in kullanıldığı yerleri bulur"""
+        if not self.result.interfaces:
+            return
+        
+        # Tüm interface isimleri için tek bir regex: her dosya bir kez taranır
+        pattern = compile_usage_pattern(self.result.interfaces)
+        
         for class_name, class_info in self.result.classes.items():
-            file_path = class_info['file_path']
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                for iface_name in self.result.interfaces:
-                    # Field declaration, parameter, return type olarak kullanım
-                    patterns = [
-                        rf'\b{iface_name}\s+\w+',  # Type declaration
-                        rf'<{iface_name}>',        # Generic type
-                        rf'\({iface_name}\s+',     # Parameter
-                    ]
-                    for pattern in patterns:
-                        if re.search(pattern, content):
-                            if class_name not in self.result.interfaces[iface_name].usages:
-                                self.result.interfaces[iface_name].usages.append(class_name)
-                            break
-            except Exception:
-                pass
+            found = {m.group(m.lastindex) for m in pattern.finditer(class_info.clean_source)}
+            for iface_name in found:
+                self.result.interfaces[iface_name].usages.add(class_name)
     
     def _analyze_method_calls(self):
         """Interface metodlarının çağrılma sayısını analiz eder"""
+        # Her dosyayı bir kez tara, tüm `.isim(` çağrılarını proje genelinde say
+        calls = Counter()
+        for class_info in self.result.classes.values():
+            calls.update(METHOD_CALL_RE.findall(class_info.clean_source))
+        
+        for iface_info in self.result.interfaces.values():
+            for method_name in iface_info.method_calls:
+                iface_info.method_calls[method_name] += calls[method_name]
+    
+    def _scan_with_automaton(self):
+        """Usage ve method çağrısı analizini Aho-Corasick ile tek geçişte yapar.
+        
+        Interface ve metod isimlerinin tüm geçişleri bir kerede bulunur, sonra
+        çevresindeki birkaç karaktere bakılarak _find_usages ve
+        _analyze_method_calls'daki regex'lerle aynı kurallara göre sınıflanır.
+        """
+        interfaces = self.result.interfaces
+        method_names = {m for info in interfaces.values() for m in info.method_calls}
+        words = interfaces.keys() | method_names
+        if not words:
+            return
+        
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, (word, word in interfaces, word in method_names))
+        automaton.make_automaton()
+        
+        calls = Counter()
         for class_name, class_info in self.result.classes.items():
-            try:
-                with open(class_info['file_path'], 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                for iface_name, iface_info in self.result.interfaces.items():
-                    for method_name in iface_info.methods:
-                        # Basit regex ile method çağrısı say
-                        pattern = rf'\.{method_name}\s*\('
-                        matches = re.findall(pattern, content)
-                        iface_info.method_calls[method_name] += len(matches)
-            except Exception:
-                pass
+            content = class_info.clean_source
+            used = set()
+            for end, (word, is_interface, is_method) in automaton.iter(content):
+                start = end - len(word) + 1
+                before = content[start - 1] if start > 0 else ''
+                if is_method and before == '.' and _is_call_suffix(content, end + 1):
+                    calls[word] += 1
+                if is_interface and word not in used and _is_usage_context(content, before, end + 1):
+                    used.add(word)
+            for iface_name in used:
+                interfaces[iface_name].usages.add(class_name)
+        
+        for iface_info in interfaces.values():
+            for method_name in iface_info.method_calls:
+                iface_info.method_calls[method_name] += calls[method_name]
     
     def _calculate_call_depths(self):
         """Her interface için call depth hesaplar"""
-        # Interface inheritance chain derinliğini hesapla
-        for iface_name, iface_info in self.result.interfaces.items():
-            depth = self._get_interface_depth(iface_name, set())
-            if depth > self.max_call_depth:
-                self.max_call_depth = depth
+        # Extends kenarlarını CSR düzeninde tut: i. interface'in parent id'leri
+        # indices[indptr[i]:indptr[i + 1]] aralığında, projede olmayan parent -1
+        interfaces = self.result.interfaces
+        names = list(interfaces)
+        ids = {name: i for i, name in enumerate(names)}
+        indptr = array('i', [0])
+        indices = array('i')
+        for name in names:
+            indices.extend(ids.get(parent, -1) for parent in interfaces[name].extends)
+            indptr.append(len(indices))
+        
+        # Interface inheritance chain derinliğini iteratif post-order DFS ile
+        # hesapla: bir interface, tüm parent'ları bittikten sonra (ters
+        # topolojik sırada) değerlendirilir, recursion limitine takılmaz.
+        depth = [0] * len(names)  # 0: henüz hesaplanmadı
+        on_stack = bytearray(len(names))
+        call_graph: Dict[str, List[str]] = {}
+        
+        for root in range(len(names)):
+            if depth[root]:
+                continue
+            on_stack[root] = 1
+            stack = [(root, indptr[root])]
+            while stack:
+                node, edge = stack[-1]
+                end = indptr[node + 1]
+                while edge < end:
+                    parent = indices[edge]
+                    edge += 1
+                    if parent >= 0 and not depth[parent] and not on_stack[parent]:
+                        stack[-1] = (node, edge)
+                        on_stack[parent] = 1
+                        stack.append((parent, indptr[parent]))
+                        break
+                else:
+                    stack.pop()
+                    on_stack[node] = 0
+                    # Projede olmayan parent: 1, döngüyü kapatan parent: 0
+                    max_depth = 0
+                    for parent in indices[indptr[node]:end]:
+                        parent_depth = depth[parent] if parent >= 0 else 1
+                        if parent_depth > max_depth:
+                            max_depth = parent_depth
+                    depth[node] = max_depth + 1
+                    call_graph[names[node]] = list(interfaces[names[node]].extends)
+        
+        self._depth_cache.update(zip(names, depth))
+        self.result.call_graph = call_graph
+        self.max_call_depth = max([self.max_call_depth, *depth])
     
-    def _get_interface_depth(self, iface_name: str, visited: Set[str]) -> int:
-        """Recursive olarak interface depth hesaplar"""
-        if iface_name in visited:
-            return 0
-        if iface_name not in self.result.interfaces:
-            return 1
-        
-        visited.add(iface_name)
-        iface_info = self.result.interfaces[iface_name]
-        
-        if not iface_info.extends:
-            return 1
-        
-        max_depth = 0
-        for parent in iface_info.extends:
-            depth = self._get_interface_depth(parent, visited)
-            max_depth = max(max_depth, depth)
-        
-        return max_depth + 1
+    def _get_interface_depth(self, iface_name: str) -> int:
+        """Önceden hesaplanmış interface depth değerini döner"""
+        return self._depth_cache.get(iface_name, 1)
     
     def calculate_ipi(self, interface_name: str) -> dict:
         """Tek bir interface için IPI hesaplar"""
+        if interface_name in self._ipi_cache:
+            return self._ipi_cache[interface_name]
         if interface_name not in self.result.interfaces:
             return None
         
-        iface = self.result.interfaces[interface_name]
+        ipi_result = self._compute_ipi(
+            self.result.interfaces[interface_name],
+            max(self.result.total_classes, 1),
+            self.max_call_depth - 1
+        )
+        self._ipi_cache[interface_name] = ipi_result
+        return ipi_result
+    
+    def calculate_all_ipi(self) -> List[dict]:
+        """Tüm interface'ler için IPI'ı tek geçişte hesaplar"""
+        # Normalizasyon paydaları tüm interface'ler için aynı, bir kez hesapla
+        total_classes = max(self.result.total_classes, 1)
+        depth_span = self.max_call_depth - 1
+        results = []
+        for iface_name, iface in self.result.interfaces.items():
+            ipi_result = self._ipi_cache.get(iface_name)
+            if ipi_result is None:
+                ipi_result = self._ipi_cache[iface_name] = self._compute_ipi(
+                    iface, total_classes, depth_span
+                )
+            results.append(ipi_result)
+        return results
+    
+    def _compute_ipi(self, iface: InterfaceInfo, total_classes: int, depth_span: int) -> dict:
+        """IPI metriklerini hesaplar; paydalar çağıran tarafından verilir"""
+        interface_name = iface.name
         
         # SIR - Single Implementation Risk
         ic = len(iface.implementations)
@@ -260,21 +786,20 @@ class InterfacePoisoningAnalyzer:
         
         # UUR - Usage Utilization Rate
         iu = len(iface.usages)
-        total_classes = max(self.result.total_classes, 1)
         uur = iu / total_classes
         
         # UMR - Unused Method Rate
         total_methods = len(iface.methods)
+        unused_methods = sum(1 for count in iface.method_calls.values() if count == 0)
         if total_methods > 0:
-            unused_methods = sum(1 for m, count in iface.method_calls.items() if count == 0)
             umr = unused_methods / total_methods
         else:
             umr = 0.0
         
         # NCD - Normalized Call Depth
-        cd = self._get_interface_depth(interface_name, set())
-        if self.max_call_depth > 1:
-            ncd = (cd - 1) / (self.max_call_depth - 1)
+        cd = self._get_interface_depth(interface_name)
+        if depth_span > 0:
+            ncd = (cd - 1) / depth_span
         else:
             ncd = 0.0
         
@@ -293,7 +818,7 @@ class InterfacePoisoningAnalyzer:
             'IU': iu,
             'UUR': round(uur, 3),
             'total_methods': total_methods,
-            'unused_methods': sum(1 for m, count in iface.method_calls.items() if count == 0),
+            'unused_methods': unused_methods,
             'UMR': round(umr, 3),
             'CallDepth': cd,
             'NCD': round(ncd, 3),
@@ -318,15 +843,8 @@ class InterfacePoisoningAnalyzer:
         lines.append(f"  δ (NCD): {self.DELTA}")
         lines.append("-" * 70)
         
-        # Her interface için IPI hesapla
-        results = []
-        for iface_name in self.result.interfaces:
-            ipi_result = self.calculate_ipi(iface_name)
-            if ipi_result:
-                results.append(ipi_result)
-        
         # IPI'ya göre sırala (yüksekten düşüğe)
-        results.sort(key=lambda x: x['IPI'], reverse=True)
+        results = sorted(self.results, key=lambda x: x['IPI'], reverse=True)
         
         lines.append("\n" + "=" * 70)
         lines.append("INTERFACE POISONING INDEX (IPI) RESULTS")
@@ -385,12 +903,6 @@ class InterfacePoisoningAnalyzer:
     
     def export_json(self, output_path: str):
         """Sonuçları JSON olarak export eder"""
-        results = []
-        for iface_name in self.result.interfaces:
-            ipi_result = self.calculate_ipi(iface_name)
-            if ipi_result:
-                results.append(ipi_result)
-        
         data = {
             'project': self.project_path,
             'total_classes': self.result.total_classes,
@@ -401,7 +913,7 @@ class InterfacePoisoningAnalyzer:
                 'gamma_UMR': self.GAMMA,
                 'delta_NCD': self.DELTA
             },
-            'results': results
+            'results': self.results
         }
         
         with open(output_path, 'w', encoding='utf-8') as f: